@@ -3,15 +3,20 @@ Small script that will check each NHL Teams schedule
 And print out the amount of games that are watchable in different timezones
 The window during which you are willing to watch games is defined in the _precompute_time_windows method
 """
-import requests
-import json
-from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import List, Tuple, Dict
+import aiohttp
+import asyncio
+import heapq
+import numpy as np
+import orjson
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple, Dict
 import concurrent.futures
-from functools import lru_cache
+import os
 import threading
 
+# Single shared tzinfo instead of one lookup per parsed game
+_UTC = timezone.utc
+
 
 class NHLScheduleAnalyzer:
     """
@@ -26,22 +31,28 @@ class NHLScheduleAnalyzer:
         52: 'WPG', 54: 'VGK', 55: 'SEA', 59: 'UTA'
     }
 
-    # Pre-converted viewing windows
-    VIEWING_WINDOWS_TIME = {}
+    # Pre-converted viewing windows as seconds since midnight, indexed Monday=0 .. Sunday=6
+    VIEWING_WINDOWS_BY_IDX = []
+
+    # Schedules only change daily, so reruns within the same day read from here
+    DISK_CACHE_DIR = ".nhl_cache"
 
     def __init__(self, max_workers: int = 10):
         self.team_list = list(self.NHL_TEAMS.values())
         self.max_workers = max_workers
-        self._session = requests.Session()
         self._cache = {}
         self._cache_lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
 
         # Pre-compute time objects and precache current date to avoid repetition
         self._precompute_time_windows()
         self.current_date = datetime.now().date()
+        self._tz_offsets = np.arange(-12, 13)
+        # The 25 offsets are fixed, format their labels once
+        self._tz_labels = {tz: f"UTC{tz:+d}" for tz in range(-12, 13)}
 
     def _precompute_time_windows(self):
-        """Convert time strings to time objects for faster comparisons."""
+        """Convert time strings to integer seconds since midnight for faster comparisons."""
         viewing_windows_str = {
             "Monday": ("15:00:00", "22:30:00"),
             "Tuesday": ("15:00:00", "22:30:00"),
@@ -52,24 +63,79 @@ class NHLScheduleAnalyzer:
             "Sunday": ("09:00:00", "22:00:00"),
         }
 
-        for day, (start_str, end_str) in viewing_windows_str.items():
+        windows = []
+        for start_str, end_str in viewing_windows_str.values():
             start_time = datetime.strptime(start_str, "%H:%M:%S").time()
             end_time = datetime.strptime(end_str, "%H:%M:%S").time()
-            self.VIEWING_WINDOWS_TIME[day] = (start_time, end_time)
+            windows.append((
+                start_time.hour * 3600 + start_time.minute * 60 + start_time.second,
+                end_time.hour * 3600 + end_time.minute * 60 + end_time.second,
+            ))
+
+        self.VIEWING_WINDOWS_BY_IDX = windows
+
+        # Same bounds for the vectorized path, quantized to int16 minutes —
+        # game starts are on the minute and narrow lanes double SIMD throughput
+        self._window_start_min = np.array([start // 60 for start, _ in windows], dtype=np.int16)
+        self._window_end_min = np.array([end // 60 for _, end in windows], dtype=np.int16)
 
-    @lru_cache(maxsize=128)
-    def fetch_api_data(self, url: str) -> str:
+    async def fetch_api_data(self, session: aiohttp.ClientSession, url: str) -> bytes:
         """
         Retrieve Data from API
-        Returns json string
+        Returns raw json bytes, orjson parses those directly
         """
         try:
-            response = self._session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"API request failed for {url}: {e}")
-            return "{}"
+            return b"{}"
+
+    async def _fetch_and_parse(self, session: aiohttp.ClientSession,
+                               team: str) -> Tuple[str, List[Tuple[datetime, str]]]:
+        """Fetch one team's schedule and parse it as soon as the response lands."""
+        parsed_games = self._load_disk_cache(team)
+        if parsed_games is None:
+            url = f"https://api-web.nhle.com/v1/club-schedule-season/{team}/now"
+            json_data = await self.fetch_api_data(session, url)
+            parsed_games = self._parse_schedule(json_data)
+            # Don't persist empty results, a failed fetch would poison the day
+            if parsed_games:
+                self._save_disk_cache(team, parsed_games)
+
+        return (team, parsed_games)
+
+    def _disk_cache_path(self, team: str) -> str:
+        return os.path.join(self.DISK_CACHE_DIR, f"{team}.json")
+
+    def _load_disk_cache(self, team: str) -> Optional[List[Tuple[datetime, str]]]:
+        """Load a team's parsed schedule from disk if it was saved today."""
+        # Any unusable cache file — unreadable, invalid json, or json of the
+        # wrong shape — just means a refetch, never a crash
+        try:
+            with open(self._disk_cache_path(team), "rb") as cache_file:
+                cached = orjson.loads(cache_file.read())
+
+            if cached.get("date") != self.current_date.isoformat():
+                return None
+
+            return [(datetime.fromisoformat(dt_str), date_str) for dt_str, date_str in cached.get("games", [])]
+        except (OSError, orjson.JSONDecodeError, AttributeError, ValueError, TypeError):
+            return None
+
+    def _save_disk_cache(self, team: str, parsed_games: List[Tuple[datetime, str]]) -> None:
+        """Persist a team's parsed schedule keyed by today's date."""
+        payload = {
+            "date": self.current_date.isoformat(),
+            "games": [(dt.isoformat(), date_str) for dt, date_str in parsed_games],
+        }
+        try:
+            os.makedirs(self.DISK_CACHE_DIR, exist_ok=True)
+            with open(self._disk_cache_path(team), "wb") as cache_file:
+                cache_file.write(orjson.dumps(payload))
+        except OSError:
+            pass
 
     def get_team_schedule_cached(self, team: str) -> List[Tuple[datetime, str]]:
         """
@@ -80,9 +146,31 @@ class NHLScheduleAnalyzer:
             if team in self._cache:
                 return self._cache[team]
 
-        url = f"https://api-web.nhle.com/v1/club-schedule-season/{team}/now"
-        json_data = self.fetch_api_data(url)
-        schedule_data = json.loads(json_data)
+            # Only one thread fetches a given team, the rest wait on its event
+            fetch_event = self._inflight.get(team)
+            if fetch_event is None:
+                fetch_event = threading.Event()
+                self._inflight[team] = fetch_event
+                is_fetching_thread = True
+            else:
+                is_fetching_thread = False
+
+        if not is_fetching_thread:
+            fetch_event.wait()
+            return self._cache.get(team, [])
+
+        try:
+            asyncio.run(self.warm_cache_async([team]))
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(team, None)
+            fetch_event.set()
+
+        return self._cache[team]
+
+    def _parse_schedule(self, json_data: bytes) -> List[Tuple[datetime, str]]:
+        """Parse the raw schedule json into (utc datetime, date string) pairs."""
+        schedule_data = orjson.loads(json_data)
 
         games = schedule_data.get('games', [])
         parsed_games = []
@@ -94,52 +182,83 @@ class NHLScheduleAnalyzer:
                 start_time = game.get('startTimeUTC', '')
                 if start_time:
                     try:
-                        dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                        # The API format is fixed (YYYY-MM-DDTHH:MM:SSZ), slicing
+                        # skips both the str.replace and the fromisoformat parser
+                        dt = datetime(
+                            int(start_time[0:4]), int(start_time[5:7]), int(start_time[8:10]),
+                            int(start_time[11:13]), int(start_time[14:16]), int(start_time[17:19]),
+                            tzinfo=_UTC,
+                        )
                         if dt.date() > self.current_date:
-                            parsed_games.append((dt, start_time.split('T')[0]))
-                    except (ValueError, AttributeError):
+                            parsed_games.append((dt, start_time[:10]))
+                    except (ValueError, TypeError):
                         continue
 
-        # Caching the result
-        with self._cache_lock:
-            self._cache[team] = parsed_games
-
         return parsed_games
 
-    def analyze_team_viewing_time(self, team: str, timezone_offset: int) -> Tuple[str, int, List[str]]:
+    def analyze_team_viewing_time(self, team: str, timezone_offset: int,
+                                  collect_dates: bool = False) -> Tuple[str, int, Optional[List[str]]]:
         """
         Analyze the gamedates
         returns a team with the viewable ganes per date
+        Game dates are only gathered when collect_dates is set, most callers
+        discard them and the string appends are pure overhead
         """
         schedule = self.get_team_schedule_cached(team)
 
         viewable_games = 0
-        game_dates = []
+        game_dates = [] if collect_dates else None
 
         # Pre-calculate timezone offset
         tz_delta = timedelta(hours=timezone_offset)
 
+        # Bind the hot lookups to locals, LOAD_ATTR per iteration adds up
+        windows = self.VIEWING_WINDOWS_BY_IDX
+        append_date = game_dates.append if collect_dates else None
+
         for utc_datetime, date_str in schedule:
             local_time = utc_datetime + tz_delta # apply offset due to timezones
-            weekday = local_time.strftime("%A")
-            local_time_only = local_time.time()
+            seconds_of_day = local_time.hour * 3600 + local_time.minute * 60 + local_time.second
 
-            # Using the faster look up due to cached data
-            if weekday in self.VIEWING_WINDOWS_TIME:
-                start_time, end_time = self.VIEWING_WINDOWS_TIME[weekday]
-                if start_time <= local_time_only <= end_time:
-                    viewable_games += 1
-                    game_dates.append(date_str)
+            # weekday() is a plain integer, no locale machinery involved
+            start_sec, end_sec = windows[local_time.weekday()]
+            if start_sec <= seconds_of_day <= end_sec:
+                viewable_games += 1
+                if append_date:
+                    append_date(date_str)
 
         return (team, viewable_games, game_dates)
 
-    def rank_teams_by_viewing_availability_parallel(self, timezone_offset: int) -> List[List]:
+    def analyze_team_all_timezones(self, team: str) -> Tuple[str, np.ndarray]:
+        """
+        Count the viewable games for every UTC offset in a few ufunc calls
+        Returns the team with a count vector indexed by tz_offset + 12
+        """
+        schedule = self.get_team_schedule_cached(team)
+        if not schedule:
+            return (team, np.zeros(25, dtype=np.int64))
+
+        utc_seconds = np.fromiter(
+            (int(game[0].timestamp()) for game in schedule),
+            dtype=np.int64, count=len(schedule)
+        )
+
+        # games x 25 matrix of local epoch seconds via broadcasting
+        local = utc_seconds[:, None] + self._tz_offsets[None, :] * 3600
+        weekday = (local // 86400 + 3) % 7  # epoch day zero was a Thursday, Monday=0
+        time_of_day_min = ((local // 60) % 1440).astype(np.int16)
+
+        mask = (time_of_day_min >= self._window_start_min[weekday]) & (time_of_day_min <= self._window_end_min[weekday])
+        return (team, mask.sum(axis=0))
+
+    def rank_teams_by_viewing_availability_parallel(self, timezone_offset: int,
+                                                    collect_dates: bool = False) -> List[List]:
         """
         Processing the data in paralell to speed up the process
         returns sorted list of teams
         """
         def process_team(team):
-            return self.analyze_team_viewing_time(team, timezone_offset)
+            return self.analyze_team_viewing_time(team, timezone_offset, collect_dates)
 
         team_rankings = []
 
@@ -160,64 +279,70 @@ class NHLScheduleAnalyzer:
         # Sort by game count in descending order
         return sorted(team_rankings, key=lambda x: x[1], reverse=True)
 
-    def generate_timezone_analysis_parallel(self, top_n_teams: int = 5) -> Dict[str, Dict[str, int]]:
+    def generate_timezone_analysis_parallel(self, top_n_teams: int = 5) -> Dict[int, Dict[str, int]]:
         """
-        parallel processing across all timezones.
+        Rank the top teams for every timezone, one schedule pass per team.
+        Keyed by integer UTC offset, labels are only formatted when printing.
         """
-        timezone_analysis = defaultdict(lambda: defaultdict(int))
+        timezone_analysis: Dict[int, Dict[str, int]] = {}
         timezone_range = list(range(-12, 13))  # UTC-12 to UTC+12
 
-        def process_timezone(tz_offset):
-            team_rankings = self.rank_teams_by_viewing_availability_parallel(tz_offset)
-            result = {}
-            for i in range(min(top_n_teams, len(team_rankings))):
-                team_name, game_count, _ = team_rankings[i]
-                result[team_name] = game_count
-            return tz_offset, result
-
-        # Process multiple timezones in parallel (CPU-bound after caching)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(timezone_range))) as executor:
-            future_to_tz = {executor.submit(process_timezone, tz): tz for tz in timezone_range}
+        # One traversal per team covers every timezone at once. After warm_cache
+        # this is pure CPU work, so a thread pool would only add GIL contention
+        team_counts = []
+        for team in self.team_list:
+            try:
+                team_counts.append(self.analyze_team_all_timezones(team))
+            except Exception as exc:
+                print(f'Team {team} generated an exception: {exc}')
 
-            for future in concurrent.futures.as_completed(future_to_tz):
-                try:
-                    tz_offset, team_data = future.result()
-                    timezone_key = f"UTC{tz_offset:+d}"
-                    timezone_analysis[timezone_key] = team_data
-                except Exception as exc:
-                    tz = future_to_tz[future]
-                    print(f'Timezone {tz} generated an exception: {exc}')
+        # Ranking per timezone is just an index into the per-team count vectors,
+        # nlargest keeps a k-sized heap instead of sorting all 32 teams
+        for tz_offset in timezone_range:
+            idx = tz_offset + 12
+            top_teams = heapq.nlargest(top_n_teams, team_counts, key=lambda tc: tc[1][idx])
+            timezone_analysis[tz_offset] = {team: int(counts[idx]) for team, counts in top_teams}
 
-        return dict(timezone_analysis)
+        return timezone_analysis
 
 
-    def print_analysis_summary(self, analysis_data: Dict[str, Dict[str, int]]) -> None:
+    def print_analysis_summary(self, analysis_data: Dict[int, Dict[str, int]]) -> None:
         """Print a formatted summary"""
 
         print("NHL Viewing Schedule Summary \n")
-        # Sort timezones by their offset instead of alphabetically
-        def timezone_sort_key(timezone_str):
-            # Extract the numerical offset from strings like "UTC-12", "UTC+5", etc.
-            if timezone_str.startswith("UTC"):
-                offset_str = timezone_str[3:]  # Remove "UTC" prefix
-                return int(offset_str)
-            return 0  # Fallback for unexpected format
-
-        sorted_timezones = sorted(analysis_data.keys(), key=timezone_sort_key)
-
-        for timezone in sorted_timezones:
-            teams = analysis_data[timezone]
-            print(f"\n{timezone}:")
+
+        # The integer keys sort directly, no label parsing needed
+        for tz_offset in sorted(analysis_data):
+            teams = analysis_data[tz_offset]
+            print(f"\n{self._tz_labels[tz_offset]}:")
             for team, count in teams.items():
                 print(f"  {team}: {count} viewable games")
 
+    async def warm_cache_async(self, teams: Optional[List[str]] = None):
+        """Fetch all team schedules concurrently on a single event loop"""
+        if teams is None:
+            teams = self.team_list
+
+        # Every request hits the same host, so the per-host limit has to match
+        # the total limit or the extra connections just queue up
+        pool_size = max(32, self.max_workers)
+        connector = aiohttp.TCPConnector(
+            limit=pool_size, limit_per_host=pool_size,
+            keepalive_timeout=30, ttl_dns_cache=300,
+        )
+        # as_completed overlaps each parse with the requests still in flight,
+        # instead of waiting for gather to drain everything. The session stays
+        # a local so concurrent event loops never share one across threads
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [asyncio.create_task(self._fetch_and_parse(session, team)) for team in teams]
+            for completed in asyncio.as_completed(tasks):
+                team, parsed_games = await completed
+                # No lock needed here, asyncio is cooperative
+                self._cache[team] = parsed_games
+
     def warm_cache(self):
         """Preload all team schedules"""
-        def load_team_schedule(team):
-            self.get_team_schedule_cached(team)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            list(executor.map(load_team_schedule, self.team_list))
+        asyncio.run(self.warm_cache_async())
 
 
 def main():